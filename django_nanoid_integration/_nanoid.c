@@ -0,0 +1,167 @@
+/*
+ * django_nanoid_integration/_nanoid.c
+ *
+ * Optional C implementation of the NanoID generation loop.
+ *
+ * Random bytes are drawn from a pool refilled by getrandom(2) on Linux or
+ * /dev/urandom elsewhere, masked and mapped to the alphabet in one pass.
+ * The GIL is held for the whole call, which protects the static pool.
+ * If this module can't be built, helpers.py falls back to pure Python.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#include <errno.h>
+#include <fcntl.h>
+#include <unistd.h>
+
+#if defined(__linux__)
+#include <sys/random.h>
+#endif
+
+#define POOL_SIZE 1024
+
+static unsigned char pool[POOL_SIZE];
+static Py_ssize_t pool_offset = POOL_SIZE;
+
+static int
+fill_random(unsigned char *buffer, size_t length)
+{
+#if defined(__linux__)
+    while (length > 0) {
+        ssize_t count = getrandom(buffer, length, 0);
+        if (count < 0) {
+            if (errno == EINTR) {
+                if (PyErr_CheckSignals() < 0) {
+                    return -1;
+                }
+                continue;
+            }
+            PyErr_SetFromErrno(PyExc_OSError);
+            return -1;
+        }
+        buffer += count;
+        length -= (size_t)count;
+    }
+    return 0;
+#else
+    int fd = open("/dev/urandom", O_RDONLY | O_CLOEXEC);
+    if (fd < 0) {
+        PyErr_SetFromErrnoWithFilename(PyExc_OSError, "/dev/urandom");
+        return -1;
+    }
+    while (length > 0) {
+        ssize_t count = read(fd, buffer, length);
+        if (count <= 0) {
+            if (count < 0 && errno == EINTR) {
+                if (PyErr_CheckSignals() < 0) {
+                    close(fd);
+                    return -1;
+                }
+                continue;
+            }
+            if (count < 0) {
+                PyErr_SetFromErrnoWithFilename(PyExc_OSError, "/dev/urandom");
+            }
+            else {
+                PyErr_SetString(PyExc_OSError, "Unexpected end of /dev/urandom");
+            }
+            close(fd);
+            return -1;
+        }
+        buffer += count;
+        length -= (size_t)count;
+    }
+    close(fd);
+    return 0;
+#endif
+}
+
+PyDoc_STRVAR(fast_nanoid_doc,
+"fast_nanoid(alphabet, mask, size)\n"
+"--\n"
+"\n"
+"Generate a NanoID of `size` characters from an ASCII `alphabet`,\n"
+"rejecting random bytes whose masked value is outside the alphabet.");
+
+static PyObject *
+fast_nanoid(PyObject *module, PyObject *args)
+{
+    PyObject *alphabet;
+    unsigned int mask;
+    Py_ssize_t size;
+
+    if (!PyArg_ParseTuple(args, "UIn:fast_nanoid", &alphabet, &mask, &size)) {
+        return NULL;
+    }
+
+    if (!PyUnicode_IS_ASCII(alphabet)) {
+        PyErr_SetString(PyExc_ValueError, "alphabet must only contain ASCII characters");
+        return NULL;
+    }
+
+    Py_ssize_t alphabet_len = PyUnicode_GET_LENGTH(alphabet);
+    if (alphabet_len == 0 || size < 0) {
+        PyErr_SetString(PyExc_ValueError, "alphabet must not be empty and size must not be negative");
+        return NULL;
+    }
+    const Py_UCS1 *characters = PyUnicode_1BYTE_DATA(alphabet);
+
+    PyObject *nanoid = PyUnicode_New(size, 127);
+    if (nanoid == NULL) {
+        return NULL;
+    }
+    Py_UCS1 *out = PyUnicode_1BYTE_DATA(nanoid);
+
+    Py_ssize_t length = 0;
+    while (length < size) {
+        if (pool_offset == POOL_SIZE) {
+            if (fill_random(pool, POOL_SIZE) < 0) {
+                Py_DECREF(nanoid);
+                return NULL;
+            }
+            pool_offset = 0;
+        }
+
+        Py_ssize_t index = pool[pool_offset++] & mask;
+        if (index < alphabet_len) {
+            out[length++] = characters[index];
+        }
+    }
+
+    return nanoid;
+}
+
+PyDoc_STRVAR(reset_pool_doc,
+"reset_pool()\n"
+"--\n"
+"\n"
+"Discard the pooled random bytes, e.g. in a forked child process.");
+
+static PyObject *
+reset_pool(PyObject *module, PyObject *Py_UNUSED(ignored))
+{
+    pool_offset = POOL_SIZE;
+    Py_RETURN_NONE;
+}
+
+static PyMethodDef nanoid_methods[] = {
+    {"fast_nanoid", fast_nanoid, METH_VARARGS, fast_nanoid_doc},
+    {"reset_pool", reset_pool, METH_NOARGS, reset_pool_doc},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef nanoid_module = {
+    .m_base = PyModuleDef_HEAD_INIT,
+    .m_name = "_nanoid",
+    .m_doc = "Optional C implementation of the NanoID generation loop.",
+    .m_size = -1,
+    .m_methods = nanoid_methods,
+};
+
+PyMODINIT_FUNC
+PyInit__nanoid(void)
+{
+    return PyModule_Create(&nanoid_module);
+}
@@ -29,7 +29,8 @@ Constants:
     UNSAFE_UPPERCASE (str): Unsafe uppercase letters.
     UNSAFE_LOWERCASE (str): Unsafe lowercase letters.
 
-    ALPHABET_CONFIG (dict): A dictionary of predefined alphabet configurations for various use cases.
+    ALPHABET_CONFIG (Mapping): A read-only mapping of predefined alphabet configurations for various use cases.
+    ALPHABET_CONFIG_BYTES (Mapping): The predefined alphabets of ALPHABET_CONFIG as ASCII bytes.
 
 Usage:
     Import the desired alphabet or use ALPHABET_CONFIG to get a predefined set:
@@ -38,6 +39,11 @@ Usage:
     safe_alphabet = ALPHABET_CONFIG['safe']
 """
 
+# Standard library imports
+import sys
+from types import MappingProxyType
+from typing import Final, Mapping
+
 
 # UPPERCASE
 UPPERCASE_NUMBERS_SAFE = "34679"
@@ -55,24 +61,33 @@ LOWERCASE_LETTERS_UNSAFE = "bgiloqsz"
 NUMBERS = "0123456789"
 
 # Combine safe characters for easy reference
-SAFE_NUMBERS = UPPERCASE_NUMBERS_SAFE + LOWERCASE_NUMBERS_SAFE
+SAFE_NUMBERS = "".join((UPPERCASE_NUMBERS_SAFE, LOWERCASE_NUMBERS_SAFE))
 SAFE_UPPERCASE = UPPERCASE_LETTERS_SAFE
 SAFE_LOWERCASE = LOWERCASE_LETTERS_SAFE
 
 # Combine unsafe characters for reference
-UNSAFE_NUMBERS = UPPERCASE_NUMBERS_UNSAFE + LOWERCASE_NUMBERS_UNSAFE
+UNSAFE_NUMBERS = "".join((UPPERCASE_NUMBERS_UNSAFE, LOWERCASE_NUMBERS_UNSAFE))
 UNSAFE_UPPERCASE = UPPERCASE_LETTERS_UNSAFE
 UNSAFE_LOWERCASE = LOWERCASE_LETTERS_UNSAFE
 
 
 # ALPHABET CONFIGURATION
-ALPHABET_CONFIG = {
-    "safe": SAFE_UPPERCASE + SAFE_LOWERCASE + LOWERCASE_NUMBERS_SAFE,
-    "unsafe": SAFE_NUMBERS + UNSAFE_NUMBERS + SAFE_UPPERCASE + UNSAFE_UPPERCASE + SAFE_LOWERCASE + UNSAFE_LOWERCASE,
-    "numbers": NUMBERS,
-    "safe_letters": SAFE_UPPERCASE + SAFE_LOWERCASE,
-    "safe_letters_uppercase": SAFE_UPPERCASE,
-    "safe_letters_lowercase": SAFE_LOWERCASE,
-    "safe_letters_uppercase_and_numbers": SAFE_UPPERCASE + UPPERCASE_NUMBERS_SAFE,
-    "safe_letters_lowercase_and_numbers": SAFE_LOWERCASE + LOWERCASE_NUMBERS_SAFE,   
-}
+# Read-only, so the predefined alphabets can't be changed at runtime
+ALPHABET_CONFIG: Final[Mapping[str, str]] = MappingProxyType({
+    name: sys.intern("".join(characters))
+    for name, characters in {
+        "safe": (SAFE_UPPERCASE, SAFE_LOWERCASE, LOWERCASE_NUMBERS_SAFE),
+        "unsafe": (SAFE_NUMBERS, UNSAFE_NUMBERS, SAFE_UPPERCASE, UNSAFE_UPPERCASE, SAFE_LOWERCASE, UNSAFE_LOWERCASE),
+        "numbers": (NUMBERS,),
+        "safe_letters": (SAFE_UPPERCASE, SAFE_LOWERCASE),
+        "safe_letters_uppercase": (SAFE_UPPERCASE,),
+        "safe_letters_lowercase": (SAFE_LOWERCASE,),
+        "safe_letters_uppercase_and_numbers": (SAFE_UPPERCASE, UPPERCASE_NUMBERS_SAFE),
+        "safe_letters_lowercase_and_numbers": (SAFE_LOWERCASE, LOWERCASE_NUMBERS_SAFE),
+    }.items()
+})
+
+# The predefined alphabets as bytes, used for NanoID generation with bytes.translate
+ALPHABET_CONFIG_BYTES: Final[Mapping[str, bytes]] = MappingProxyType({
+    name: characters.encode("ascii") for name, characters in ALPHABET_CONFIG.items()
+})
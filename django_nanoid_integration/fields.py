@@ -11,11 +11,13 @@ Inspired by [Gökhan Öztürk's django-nanoid-field](https://github.com/goztrk/d
 from django.conf import settings
 from django.db import models
 
-# Third-party imports
-from nanoid import generate
-
 # Local application imports
-from .helpers import get_alphabet_characters
+from .helpers import (
+    _generate_nanoid,
+    _get_alphabet_bytes,
+    _precompute_nanoid,
+    get_alphabet_characters
+)
 
 
 class NanoIDField(models.CharField):
@@ -60,8 +62,29 @@ class NanoIDField(models.CharField):
             "size", getattr(settings, 'NANOID_SIZE', 5)
         )
 
+        # The alphabet never changes after initialization, so resolve it once
+        self._resolved_alphabet = get_alphabet_characters(
+            self.alphabet,
+            self.alphabet_predefined
+        )
+
+        self._alphabet_bytes = _get_alphabet_bytes(
+            self.alphabet,
+            self.alphabet_predefined
+        )
+
+        # Mask, step and translation table are invariant for this field as well
+        (
+            self._mask,
+            self._step,
+            self._translate_table,
+            self._translate_deletechars
+        ) = _precompute_nanoid(self._resolved_alphabet, self.size, self._alphabet_bytes)
+
         # CharField required
         kwargs["max_length"] = self.size
+        # Without a default, CharField initializes new instances with '' instead of None,
+        # and pre_save would not generate a NanoID
         kwargs["default"] = None
 
         # Editable and unique properties
@@ -84,10 +107,17 @@ class NanoIDField(models.CharField):
         Returns:
             str: The current value of the field or a newly generated NanoID.
         """        
-        value = getattr(model_instance, self.attname)
+        # Concrete field values live in the instance __dict__ under attname,
+        # accessing it directly skips the field descriptor. A deferred field is
+        # missing there, so load it through the descriptor instead.
+        instance_dict = model_instance.__dict__
+        if self.attname in instance_dict:
+            value = instance_dict[self.attname]
+        else:
+            value = getattr(model_instance, self.attname)
         if value is None:
             value = self.nanoid()
-            setattr(model_instance, self.attname, value)
+            instance_dict[self.attname] = value
         return value
 
     def nanoid(self):
@@ -97,10 +127,14 @@ class NanoIDField(models.CharField):
         Returns:
             str: A newly generated NanoID.
         """
-        return generate(get_alphabet_characters(
-            self.alphabet,
-            self.alphabet_predefined
-        ), self.size)
+        return _generate_nanoid(
+            self._resolved_alphabet,
+            self.size,
+            self._mask,
+            self._step,
+            self._translate_table,
+            self._translate_deletechars
+        )
 
     def get_internal_type(self):
         """
@@ -4,8 +4,45 @@
 HELPER FUNCTIONS
 """
 
+# Standard library imports
+import functools
+import math
+import os
+import threading
+
 # Local application imports
-from .alphabets import ALPHABET_CONFIG
+from .alphabets import ALPHABET_CONFIG, ALPHABET_CONFIG_BYTES
+
+# Optional C implementation of the generation loop, see _nanoid.c
+try:
+    from ._nanoid import fast_nanoid as _c_fast_nanoid, reset_pool as _c_reset_pool
+except ImportError:
+    _c_fast_nanoid = _c_reset_pool = None
+
+# Number of random bytes fetched per os.urandom call
+RANDOM_POOL_SIZE = 1024
+
+# Keyspace size above which a collision is negligible and not worth a lookup
+COLLISION_CHECK_THRESHOLD = 2 ** 48
+
+_random_pool = threading.local()
+
+
+def _reset_random_pool() -> None:
+    """
+    Discard the random pool in a forked child process.
+
+    Otherwise parent and child would draw the same bytes and generate the same NanoIDs.
+    """
+    global _random_pool
+    _random_pool = threading.local()
+    if _c_reset_pool is not None:
+        _c_reset_pool()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_random_pool)
+
 
 def get_alphabet_characters(alphabet: str = None, alphabet_predefined: str = None) -> str:
     """
@@ -36,14 +73,185 @@ def get_alphabet_characters(alphabet: str = None, alphabet_predefined: str = Non
     # Use the custom alphabet if provided
     if alphabet:
         return alphabet
-    else:
-        # If not, use the predefined alphabet (if provided and valid)
-        if alphabet_predefined:
-            if alphabet_predefined in ALPHABET_CONFIG:
-                return ALPHABET_CONFIG[alphabet_predefined]
-            else:
-                raise ValueError(
-                    f"Predefined alphabet '{alphabet_predefined}' does not exist. Please choose a valid predefined alphabet.")
-        else:
-            # Default to 'safe' alphabet if neither is provided
-            return ALPHABET_CONFIG['safe']
+
+    # If not, use the predefined alphabet, defaulting to 'safe'
+    try:
+        return ALPHABET_CONFIG[alphabet_predefined or 'safe']
+    except KeyError:
+        raise ValueError(
+            f"Predefined alphabet '{alphabet_predefined}' does not exist. Please choose a valid predefined alphabet.") from None
+
+
+def _get_alphabet_bytes(alphabet: str = None, alphabet_predefined: str = None) -> bytes:
+    """
+    Determine the alphabet like `get_alphabet_characters`, but as ASCII bytes.
+
+    Predefined alphabets are taken from ALPHABET_CONFIG_BYTES without encoding.
+    The predefined alphabet name is expected to be validated by
+    `get_alphabet_characters` already.
+
+    Returns:
+        bytes: The alphabet as ASCII bytes, or None if it contains non-ASCII characters.
+    """
+    if alphabet:
+        return _encode_alphabet(alphabet)
+    return ALPHABET_CONFIG_BYTES[alphabet_predefined or 'safe']
+
+
+@functools.lru_cache()
+def _encode_alphabet(alphabet: str) -> bytes:
+    """
+    Return the alphabet as ASCII bytes, or None if it contains non-ASCII characters.
+    """
+    try:
+        return alphabet.encode("ascii")
+    except UnicodeEncodeError:
+        return None
+
+
+def _random_bytes(count: int) -> bytes:
+    """
+    Return `count` random bytes from a thread-local pool filled by os.urandom.
+
+    Fetching RANDOM_POOL_SIZE bytes at once amortizes the syscall over many
+    NanoIDs instead of issuing one (or more) per generated ID.
+    """
+    if count > RANDOM_POOL_SIZE:
+        return os.urandom(count)
+
+    # Pool and offset are kept in one tuple, so each call does a single
+    # lookup and a single assignment on the thread-local
+    try:
+        pool, offset = _random_pool.state
+    except AttributeError:
+        pool, offset = b"", 0
+
+    end = offset + count
+    if end > len(pool):
+        pool = os.urandom(RANDOM_POOL_SIZE)
+        offset, end = 0, count
+
+    _random_pool.state = (pool, end)
+    return pool[offset:end]
+
+
+def _translate_table(alphabet_bytes: bytes, mask: int) -> tuple:
+    """
+    Build the bytes.translate arguments mapping random bytes to alphabet bytes.
+
+    Returns:
+        tuple: A 256-byte translation table and the bytes to delete, i.e. the
+        byte values whose masked index falls outside the alphabet.
+    """
+    alphabet_len = len(alphabet_bytes)
+    table = bytes(
+        alphabet_bytes[i & mask] if (i & mask) < alphabet_len else 0
+        for i in range(256)
+    )
+    deletechars = bytes(i for i in range(256) if (i & mask) >= alphabet_len)
+    return table, deletechars
+
+
+def _nanoid_from_table(size: int, step: int, table: bytes, deletechars: bytes) -> str:
+    """
+    Generate a NanoID by translating random bytes in a single C-level call.
+
+    If no byte has to be rejected (alphabet length is a power of two), exactly
+    `size` random bytes are translated. Otherwise rejected bytes are dropped
+    via `deletechars` and batches of `step` bytes are drawn until enough
+    characters are collected.
+
+    Without the C extension, this is also used for the 'numbers' alphabet: drawing
+    a single integer below 10 ** size and zero-padding it is not faster than
+    translating pooled bytes.
+    """
+    if not deletechars:
+        return _random_bytes(size).translate(table).decode("ascii")
+
+    nanoid = b""
+    while len(nanoid) < size:
+        nanoid += _random_bytes(step).translate(table, deletechars)
+    return nanoid[:size].decode("ascii")
+
+
+def _nanoid_from_alphabet(alphabet: str, size: int, mask: int, step: int) -> str:
+    """
+    Generate a NanoID character by character.
+
+    Fallback for alphabets that cannot be represented as ASCII bytes.
+    """
+    alphabet_len = len(alphabet)
+    nanoid = []
+    while True:
+        for byte in _random_bytes(step):
+            index = byte & mask
+            if index < alphabet_len:
+                nanoid.append(alphabet[index])
+                if len(nanoid) == size:
+                    return "".join(nanoid)
+
+
+@functools.lru_cache()
+def _precompute_nanoid(alphabet: str, size: int, alphabet_bytes: bytes) -> tuple:
+    """
+    Compute the generation parameters that only depend on the alphabet and size.
+
+    Args:
+        alphabet (str): The characters to build the NanoID from.
+        size (int): The length of the NanoID.
+        alphabet_bytes (bytes): The alphabet as ASCII bytes, or None if it is not ASCII.
+
+    Returns:
+        tuple: The bit mask, the number of random bytes drawn per step,
+        the translation table (or None) and the bytes rejected by the mask.
+    """
+    alphabet_len = len(alphabet)
+    mask = (2 << ((alphabet_len - 1).bit_length() or 1) - 1) - 1
+    step = math.ceil(1.6 * mask * size / alphabet_len)
+
+    if alphabet_bytes is None:
+        return mask, step, None, None
+
+    table, deletechars = _translate_table(alphabet_bytes, mask)
+    return mask, step, table, deletechars
+
+
+def _generate_nanoid(
+    alphabet: str,
+    size: int,
+    mask: int,
+    step: int,
+    table: bytes,
+    deletechars: bytes
+) -> str:
+    """
+    Generate a NanoID from parameters computed by `_precompute_nanoid`.
+
+    ASCII alphabets are generated by the C extension if it is available.
+    """
+    if table is None:
+        return _nanoid_from_alphabet(alphabet, size, mask, step)
+    if _c_fast_nanoid is not None:
+        return _c_fast_nanoid(alphabet, mask, size)
+    return _nanoid_from_table(size, step, table, deletechars)
+
+
+def _fast_nanoid(alphabet: str, size: int) -> str:
+    """
+    Generate a NanoID from the given alphabet and size.
+
+    Uses the same mask/step rejection sampling as the reference NanoID
+    implementation, but draws the random bytes from a pooled buffer and maps
+    them to ASCII alphabets with bytes.translate.
+
+    Args:
+        alphabet (str): The characters to build the NanoID from.
+        size (int): The length of the NanoID.
+
+    Returns:
+        str: A newly generated NanoID.
+    """
+    mask, step, table, deletechars = _precompute_nanoid(
+        alphabet, size, _encode_alphabet(alphabet)
+    )
+    return _generate_nanoid(alphabet, size, mask, step, table, deletechars)
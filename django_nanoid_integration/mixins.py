@@ -4,14 +4,24 @@
 Mixins for NanoID Fields
 """
 
+# Standard library imports
+import functools
+import operator
+from collections import defaultdict
+
 # Django Imports
 from django.db import models, transaction
+from django.db.models import Case, F, Q, Value, When
 from django.db.utils import IntegrityError
 
+# Local application imports
+from .fields import NanoIDField
+from .helpers import COLLISION_CHECK_THRESHOLD
+
 # Logging
 import logging
 
-logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
 
 
 class UniqueNanoIDMixin(models.Model):
@@ -24,6 +34,8 @@ class UniqueNanoIDMixin(models.Model):
 
     Attributes:
         nanoid_max_attempts (int): The maximum number of attempts to generate a unique NanoID.
+        nanoid_collision_check_threshold (int): Keyspace size (alphabet length ** size) above
+            which generated NanoIDs are not looked up in the database before saving.
 
     Note:
         This is an abstract base class and should be used as a mixin in other models.
@@ -33,6 +45,7 @@ class UniqueNanoIDMixin(models.Model):
     # This ensures that it has access to all the necessary model methods and attributes.
 
     nanoid_max_attempts = 10
+    nanoid_collision_check_threshold = COLLISION_CHECK_THRESHOLD
 
     class Meta:
         """
@@ -42,31 +55,47 @@ class UniqueNanoIDMixin(models.Model):
 
         abstract = True
 
-    def get_unique_nanoid_fields(self):
+    @classmethod
+    def _collect_nanoid_fields(cls):
+        """
+        Collect the NanoID field names of the model once and cache them on the class.
+
+        Only concrete fields can be NanoIDFields, so reverse relations are not traversed.
+        The cache is looked up in the class' own __dict__, so subclasses don't reuse
+        the field names of their parent model.
         """
-        Retrieve a list of fields that have unique=True and are instances of NanoIDField.
+        if "_all_nanoid_field_names" not in cls.__dict__:
+            nanoid_fields = [
+                field for field in cls._meta.concrete_fields if isinstance(field, NanoIDField)
+            ]
+            cls._unique_nanoid_field_names = tuple(
+                field.name for field in nanoid_fields if field.unique
+            )
+            cls._all_nanoid_field_names = tuple(field.name for field in nanoid_fields)
+
+    @classmethod
+    def get_unique_nanoid_fields(cls):
+        """
+        Retrieve the fields that have unique=True and are instances of NanoIDField.
 
         Returns:
-            list: List of field names with unique=True and instances of NanoIDField.
+            tuple: Field names with unique=True and instances of NanoIDField.
         """
-        return [
-            field.name
-            for field in self._meta.get_fields()
-            if hasattr(field, "unique") and field.unique and hasattr(field, "nanoid")
-        ]
+        cls._collect_nanoid_fields()
+        return cls._unique_nanoid_field_names
 
-    def get_all_nanoid_fields(self):
+    @classmethod
+    def get_all_nanoid_fields(cls):
         """
-        Retrieve a list of all fields that are instances of NanoIDField.
+        Retrieve all fields that are instances of NanoIDField.
 
         Returns:
-            list: List of field names of NanoIDField instances.
+            tuple: Field names of NanoIDField instances.
         """
-        return [
-            field.name for field in self._meta.get_fields() if hasattr(field, "nanoid")
-        ]
+        cls._collect_nanoid_fields()
+        return cls._all_nanoid_field_names
 
-    def ensure_unique_nanoids(self):
+    def ensure_unique_nanoids(self, force_check=False, update_fields=None):
         """
         Ensure unique NanoIDs for fields specified as unique NanoID fields in the model.
 
@@ -74,13 +103,26 @@ class UniqueNanoIDMixin(models.Model):
         It retrieves the fields marked for unique NanoID generation and attempts to generate
         a unique NanoID for each. If a field already has a NanoID or if the record is being updated,
         it will check for the uniqueness of the NanoID. If the NanoID is not unique, it will
-        attempt to generate a new one up to a maximum number of attempts.
+        generate up to a maximum number of candidates and pick the first one not taken,
+        using a single query for all candidates.
+
+        If the keyspace of a field exceeds `nanoid_collision_check_threshold`, a collision is
+        negligible and the NanoID is assigned without querying the database. The unique
+        constraint still guards against it, and `save` retries with checked NanoIDs.
+
+        Args:
+            force_check (bool): If True, always check generated NanoIDs against the database.
+            update_fields (iterable, optional): If given, only these fields are handled.
 
         Raises:
             ValueError: If a unique NanoID cannot be generated within the max. number of attempts.
         """
 
         unique_nanoid_fields = self.get_unique_nanoid_fields()
+        if update_fields is not None:
+            unique_nanoid_fields = [
+                field_name for field_name in unique_nanoid_fields if field_name in update_fields
+            ]
         fields_to_generate = []
 
         for field_name in unique_nanoid_fields:
@@ -94,28 +136,44 @@ class UniqueNanoIDMixin(models.Model):
                     fields_to_generate.append((field_name, field_instance))
 
         for field_name, field_instance in fields_to_generate:
-            for _ in range(self.nanoid_max_attempts):
+            keyspace = len(field_instance._resolved_alphabet) ** field_instance.size
+            if not force_check and keyspace > self.nanoid_collision_check_threshold:
                 field_value_new = field_instance.nanoid()
-                if (
-                    not type(self)
-                    .objects.filter(**{field_name: field_value_new})
-                    .exists()
-                ):
+                setattr(self, field_name, field_value_new)
+                logger.debug(
+                    "Set NanoID '%s' for field '%s' without a uniqueness check.",
+                    field_value_new,
+                    field_instance,
+                )
+                continue
+
+            # Generate all candidates upfront and check them with a single query
+            candidates = [
+                field_instance.nanoid() for _ in range(self.nanoid_max_attempts)
+            ]
+            taken = set(
+                type(self)
+                .objects.filter(**{f"{field_name}__in": candidates})
+                .values_list(field_name, flat=True)
+            )
+
+            for field_value_new in candidates:
+                if field_value_new not in taken:
                     setattr(self, field_name, field_value_new)
-                    logging.debug(
+                    logger.debug(
                         "Successfully set unique NanoID '%s' for field '%s'.",
                         field_value_new,
                         field_instance,
                     )
                     break
 
-                logging.debug(
+                logger.debug(
                     "NanoID '%s' is already taken in the field '%s'. Attempting to generate another NanoID.",
                     field_value_new,
                     field_instance,
                 )
             else:
-                logging.debug(
+                logger.debug(
                     "NanoID '%s' is already taken in the field '%s'. Giving up.",
                     field_value_new,
                     field_instance,
@@ -131,19 +189,31 @@ class UniqueNanoIDMixin(models.Model):
         Override the save method to ensure unique NanoIDs before saving.
 
         This method wraps the save operation in a transaction and handles potential
-        IntegrityErrors by retrying with a new NanoID.
+        IntegrityErrors by retrying with new NanoIDs that are checked against the database.
+        If `update_fields` is passed, only those NanoID fields are generated and checked.
 
         Args:
             *args: Variable length argument list.
             **kwargs: Arbitrary keyword arguments.
         """
-        with transaction.atomic():
-            try:
-                self.ensure_unique_nanoids()
+        update_fields = kwargs.get("update_fields")
+
+        missing_fields = [
+            field_name
+            for field_name in self.get_unique_nanoid_fields()
+            if getattr(self, field_name) is None
+        ]
+        try:
+            with transaction.atomic():
+                self.ensure_unique_nanoids(update_fields=update_fields)
                 super().save(*args, **kwargs)
-            except IntegrityError:
-                # If an IntegrityError occurs, retry with a new NanoID
-                self.ensure_unique_nanoids()
+        except IntegrityError:
+            # The failed attempt has been rolled back when leaving the atomic block,
+            # retry with new, checked NanoIDs in a fresh one
+            for field_name in missing_fields:
+                setattr(self, field_name, None)
+            with transaction.atomic():
+                self.ensure_unique_nanoids(force_check=True, update_fields=update_fields)
                 super().save(*args, **kwargs)
 
     def regenerate_nanoid(self, field_name, force=False):
@@ -188,7 +258,7 @@ class UniqueNanoIDMixin(models.Model):
                 setattr(
                     self, field_name, None
                 )  # This will force a new unique NanoID to be generated
-                self.save(force_update=True)
+                self.save(update_fields=[field_name])
             else:
                 # For non-unique fields, we can simply generate a new NanoID
                 new_value = field_instance.nanoid()
@@ -197,22 +267,44 @@ class UniqueNanoIDMixin(models.Model):
 
             new_value = getattr(self, field_name)
 
-            # Update any reverse relations
+            # Update any reverse relations, grouped by related model
+            related_fields = defaultdict(list)
             for related_object in self._meta.related_objects:
                 if (
                     related_object.field.related_model == self.__class__
                     and related_object.field.to_fields[0] == field_name
                 ):
-                    related_model = related_object.related_model
-                    filter_kwargs = {
-                        f"{related_object.field.name}__{field_name}": old_value
-                    }
-                    update_kwargs = {related_object.field.name: self}
-                    related_model.objects.filter(**filter_kwargs).update(
-                        **update_kwargs
+                    related_fields[related_object.related_model].append(
+                        related_object.field
+                    )
+
+            for related_model, foreign_keys in related_fields.items():
+                if len(foreign_keys) == 1:
+                    column = foreign_keys[0].attname
+                    related_model.objects.filter(**{column: old_value}).update(
+                        **{column: new_value}
                     )
+                    continue
+
+                # Several foreign keys on the same model: update them all in a single
+                # query, leaving the columns that don't reference the old value as they are
+                columns = [foreign_key.attname for foreign_key in foreign_keys]
+                related_model.objects.filter(
+                    functools.reduce(
+                        operator.or_, (Q(**{column: old_value}) for column in columns)
+                    )
+                ).update(
+                    **{
+                        column: Case(
+                            When(**{column: old_value}, then=Value(new_value)),
+                            default=F(column),
+                            output_field=field_instance,
+                        )
+                        for column in columns
+                    }
+                )
 
-        logging.debug(
+        logger.debug(
             "Regenerated NanoID for field '%s'. Old value: '%s', New value: '%s'",
             field_instance,
             old_value,
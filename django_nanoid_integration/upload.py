@@ -10,22 +10,25 @@ Inspired by [Ilya Semenov's django-uuid-upload](https://github.com/IlyaSemenov/d
 
 # Standard library imports
 import os
-import re
-import functools
 
 # Django imports
 from django.conf import settings
 from django.core.files.storage import default_storage
-
-# Third-party imports
-from nanoid import generate
+from django.utils.deconstruct import deconstructible
 
 # Local application imports
-from .helpers import get_alphabet_characters
-
-# Configure logging
+from .helpers import (
+    COLLISION_CHECK_THRESHOLD,
+    _generate_nanoid,
+    _get_alphabet_bytes,
+    _precompute_nanoid,
+    get_alphabet_characters
+)
+
+# Logging
 import logging
-logging.basicConfig(level=logging.DEBUG)
+
+logger = logging.getLogger(__name__)
 
 
 
@@ -35,10 +38,11 @@ def upload_to_nanoid(
     remove_query_strings: bool = True,
     alphabet: str = getattr(settings, 'NANOID_ALPHABET', None),
     alphabet_predefined: str = getattr(settings, 'NANOID_ALPHABET_PREDEFINED', None),
-    size: int = getattr(settings, 'NANOID_SIZE', 5)
+    size: int = getattr(settings, 'NANOID_SIZE', 5),
+    assume_unique: bool = False
 ) -> callable:
     """
-    Returns a callable function that generates a unique file path using a NanoID.
+    Returns a callable that generates a unique file path using a NanoID.
 
     This function is intended to be used as the `upload_to` parameter in Django model fields
     to generate unique file names for uploads, improving file organization.
@@ -50,81 +54,176 @@ def upload_to_nanoid(
         alphabet (str): Custom alphabet to use for generating the NanoID. If None, uses the default.
         alphabet_predefined (str): Predefined alphabet to use. If None, uses the custom alphabet or default.
         size (int): The length of the NanoID.
+        assume_unique (bool): If True, the storage is not checked for an existing file with
+            the generated path. Recommended for sizes of 10 and above.
 
     Returns:
-        callable: A function that generates a unique file path with a NanoID.
+        NanoIDUploadTo: A callable that generates a unique file path with a NanoID.
     """
 
-    # Use functools.partial to create a callable function with the specified parameters
-    return functools.partial(
-        _upload_to_nanoid_impl,
+    return NanoIDUploadTo(
         path=path,
         preserve_original_filename=preserve_original_filename,
         remove_query_strings=remove_query_strings,
         alphabet=alphabet,
         alphabet_predefined=alphabet_predefined,
-        size=size
+        size=size,
+        assume_unique=assume_unique
     )
 
-def _upload_to_nanoid_impl(
-    instance,
-    filename,
-    path,
-    preserve_original_filename,
-    remove_query_strings,
-    alphabet,
-    alphabet_predefined,
-    size
-) -> str:
+
+@deconstructible
+class NanoIDUploadTo:
     """
-    Generates a unique file path using a NanoID, with options for subdirectory creation and query string removal.
-    
-    This is the implementation function called by `upload_to_nanoid`.
+    Callable returned by `upload_to_nanoid` that generates unique file paths using a NanoID.
+
+    The alphabet and the NanoID generation parameters are resolved once when the
+    callable is created instead of on every upload. Being deconstructible, it can
+    be serialized in migrations like the `functools.partial` used before.
 
     Args:
-        instance: The model instance that the file is being attached to.
-        filename (str): The original filename of the uploaded file.
         path (str): The base directory where files will be uploaded.
         preserve_original_filename (bool): Whether to create a subdirectory with the NanoID and keep the original filename.
         remove_query_strings (bool): Whether to remove query strings from the filename.
         alphabet (str): Custom alphabet to use for generating the NanoID.
         alphabet_predefined (str): Predefined alphabet to use for generating the NanoID.
         size (int): The length of the NanoID.
-    
-    Returns:
-        str: A unique file path.
-
-    Raises:
-        ValueError: If a unique NanoID cannot be generated after 10 attempts.
+        assume_unique (bool): Whether to skip checking the storage for an existing file.
     """
 
-    # Remove query strings from the filename if required
-    if remove_query_strings:
-        filename = re.sub(r'\?.*', '', filename)
-
-    attempts = 0
-    while attempts < 10:
-        # Generate a NanoID
-        nanoid = generate(get_alphabet_characters(alphabet, alphabet_predefined), size)
-
-        # Construct the unique file path
+    def __init__(
+        self,
+        path,
+        preserve_original_filename=False,
+        remove_query_strings=True,
+        alphabet=None,
+        alphabet_predefined=None,
+        size=5,
+        assume_unique=False
+    ) -> None:
+        self.path = path
+        self.preserve_original_filename = preserve_original_filename
+        self.remove_query_strings = remove_query_strings
+        self.alphabet = alphabet
+        self.alphabet_predefined = alphabet_predefined
+        self.size = size
+        self.assume_unique = assume_unique
+
+        self._resolved_alphabet = get_alphabet_characters(alphabet, alphabet_predefined)
+        (
+            self._mask,
+            self._step,
+            self._translate_table,
+            self._translate_deletechars
+        ) = _precompute_nanoid(
+            self._resolved_alphabet,
+            size,
+            _get_alphabet_bytes(alphabet, alphabet_predefined)
+        )
+
+        # Probing the storage is a filesystem stat or a network request,
+        # skip it if a collision is negligible anyway
+        self._check_storage = (
+            not assume_unique
+            and len(self._resolved_alphabet) ** size <= COLLISION_CHECK_THRESHOLD
+        )
+
+    def __call__(self, instance, filename) -> str:
+        """
+        Generates a unique file path using a NanoID, with options for subdirectory creation and query string removal.
+
+        Args:
+            instance: The model instance that the file is being attached to.
+            filename (str): The original filename of the uploaded file.
+
+        Returns:
+            str: A unique file path.
+
+        Raises:
+            ValueError: If a unique NanoID cannot be generated after 10 attempts.
+        """
+
+        # Remove query strings from the filename if required
+        if self.remove_query_strings:
+            filename = filename.partition('?')[0]
+
+        preserve_original_filename = self.preserve_original_filename
         if preserve_original_filename:
             sanitized_filename = filename.replace(' ', '_')
-            unique_path = os.path.join(path, nanoid, sanitized_filename)
         else:
-            ext = os.path.splitext(filename)[-1].lower()
-            unique_path = os.path.join(path, nanoid + ext)
+            ext = _get_extension(filename)
+
+        attempts = 0
+        while attempts < 10:
+            # Generate a NanoID
+            nanoid = _generate_nanoid(
+                self._resolved_alphabet,
+                self.size,
+                self._mask,
+                self._step,
+                self._translate_table,
+                self._translate_deletechars
+            )
+
+            # Construct the unique file path
+            if preserve_original_filename:
+                unique_path = os.path.join(self.path, nanoid, sanitized_filename)
+            else:
+                unique_path = os.path.join(self.path, nanoid + ext)
+
+            # Check if the file path is unique within the storage
+            if not self._check_storage or not default_storage.exists(unique_path):
+                return unique_path
+
+            attempts += 1
+            logger.debug("NanoID '%s' is already taken for the filename '%s'. Attempting to generate another NanoID.", nanoid, filename)
+
+        logger.debug("NanoID '%s' is already taken for the filename '%s'. Giving up.", nanoid, filename)
+        raise ValueError(
+            f"No unique NanoID could be generated for the filename '{filename}'. "
+            "To resolve this issue, consider increasing the NanoID size in your model's field definition using a different alphabet to improve uniqueness. "
+            "Run the following commands to apply the changes: 'python manage.py makemigrations' and then 'python manage.py migrate'."
+        )
 
-        # Check if the file path is unique within the storage
-        if not default_storage.exists(unique_path):
-            return unique_path
 
-        attempts += 1
-        logging.debug("NanoID '%s' is already taken for the filename '%s'. Attempting to generate another NanoID.", nanoid, filename)
+def _upload_to_nanoid_impl(
+    instance,
+    filename,
+    path,
+    preserve_original_filename,
+    remove_query_strings,
+    alphabet,
+    alphabet_predefined,
+    size,
+    assume_unique=False
+) -> str:
+    """
+    Generates a unique file path using a NanoID.
 
-    logging.debug("NanoID '%s' is already taken for the filename '%s'. Giving up.", nanoid, filename)
-    raise ValueError(
-        f"No unique NanoID could be generated for the filename '{filename}'. "
-        "To resolve this issue, consider increasing the NanoID size in your model's field definition using a different alphabet to improve uniqueness. "
-        "Run the following commands to apply the changes: 'python manage.py makemigrations' and then 'python manage.py migrate'."
-    )
+    Kept for migrations created with earlier versions, which reference this function
+    through a `functools.partial`. New code uses `NanoIDUploadTo`.
+
+    Returns:
+        str: A unique file path.
+    """
+    return NanoIDUploadTo(
+        path=path,
+        preserve_original_filename=preserve_original_filename,
+        remove_query_strings=remove_query_strings,
+        alphabet=alphabet,
+        alphabet_predefined=alphabet_predefined,
+        size=size,
+        assume_unique=assume_unique
+    )(instance, filename)
+
+def _get_extension(filename) -> str:
+    """
+    Return the lowercased extension of a filename, including the leading dot.
+
+    Behaves like `os.path.splitext(filename)[-1].lower()`, leading dots of the
+    name (e.g. '.bashrc') don't start an extension.
+    """
+    head, dot, ext = filename.rpartition('.')
+    if '/' in ext or not head.rpartition('/')[-1].lstrip('.'):
+        return ''
+    return dot + ext.lower()
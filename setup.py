@@ -1,5 +1,5 @@
 """Save your Django uploaded files using NanoIDs for file names or store them in directories named with NanoIDs."""
-from setuptools import setup, find_packages
+from setuptools import Extension, setup, find_packages
 
 setup(
     name='django-nanoid-integration',
@@ -11,6 +11,15 @@ setup(
     long_description_content_type='text/markdown',
     url='https://github.com/spechtx/django-nanoid-integration',
     packages=find_packages(),
+    # Optional C implementation of the NanoID generation loop,
+    # the package falls back to pure Python if it can't be built
+    ext_modules=[
+        Extension(
+            'django_nanoid_integration._nanoid',
+            sources=['django_nanoid_integration/_nanoid.c'],
+            optional=True,
+        ),
+    ],
     classifiers=[
         'Programming Language :: Python :: 3',
         'License :: OSI Approved :: MIT License',
@@ -20,6 +29,5 @@ setup(
     python_requires='>=3.6',
     install_requires=[
         'Django>=1.7',
-		'nanoid'
     ],
 )